@@ -2,14 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import timedelta
 import enum
+from functools import partial
 import logging
-from typing import Callable, Generic, TypeVar
+import threading
+from typing import TYPE_CHECKING, Callable, Generic, TypeVar
 
-from PyViCare.PyViCareDevice import Device
-from PyViCare.PyViCareFuelCell import FuelCell
-from PyViCare.PyViCareGazBoiler import GazBoiler
-from PyViCare.PyViCareHeatPump import HeatPump
 import voluptuous as vol
 
 from homeassistant.const import (
@@ -19,13 +18,17 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
     CONF_USERNAME,
 )
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.storage import STORAGE_DIR
 
+if TYPE_CHECKING:
+    from PyViCare.PyViCareDevice import Device
+
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["climate", "sensor", "binary_sensor", "water_heater"]
+PLATFORMS = ("climate", "sensor", "binary_sensor", "water_heater")
 
 DOMAIN = "vicare"
 VICARE_API = "api"
@@ -37,13 +40,16 @@ CONF_HEATING_TYPE = "heating_type"
 DEFAULT_HEATING_TYPE = "generic"
 
 
-ApiT = TypeVar("ApiT", bound=Device)
+ApiT = TypeVar("ApiT", bound="Device")
 
 
 @dataclass()
 class ViCareRequiredKeysMixin(Generic[ApiT]):
     """Mixin for required keys."""
 
+    # dataclass(slots=True) needs Python 3.10, declare the slots by hand
+    __slots__ = ("value_getter",)
+
     value_getter: Callable[[ApiT], bool]
 
 
@@ -56,31 +62,48 @@ class HeatingType(enum.Enum):
     fuelcell = "fuelcell"
 
 
-CONFIG_SCHEMA = vol.Schema(
+_HEATING_TYPE_VALIDATOR = cv.enum(HeatingType)
+
+
+def _whole_seconds(value: float | timedelta) -> int:
+    """Return a scan interval as seconds, rejecting fractions of a second."""
+    if isinstance(value, timedelta):
+        value = value.total_seconds()
+    if not float(value).is_integer():
+        raise vol.Invalid(f"{CONF_SCAN_INTERVAL} must be a whole number of seconds")
+    return int(value)
+
+
+_INNER_SCHEMA = vol.Schema(
     {
-        DOMAIN: vol.Schema(
-            {
-                vol.Required(CONF_USERNAME): cv.string,
-                vol.Required(CONF_PASSWORD): cv.string,
-                vol.Required(CONF_CLIENT_ID): cv.string,
-                vol.Optional(CONF_SCAN_INTERVAL, default=60): vol.All(
-                    cv.time_period, lambda value: value.total_seconds()
-                ),
-                vol.Optional(CONF_CIRCUIT): int,
-                vol.Optional(CONF_NAME, default="ViCare"): cv.string,
-                vol.Optional(CONF_HEATING_TYPE, default=DEFAULT_HEATING_TYPE): cv.enum(
-                    HeatingType
-                ),
-            }
-        )
-    },
-    extra=vol.ALLOW_EXTRA,
+        vol.Required(CONF_USERNAME): cv.string,
+        vol.Required(CONF_PASSWORD): cv.string,
+        vol.Required(CONF_CLIENT_ID): cv.string,
+        # Plain seconds are the common case, skip building a timedelta for them
+        vol.Optional(CONF_SCAN_INTERVAL): vol.All(
+            vol.Any(vol.Coerce(float), cv.time_period),
+            _whole_seconds,
+            vol.Range(min=1),
+        ),
+        vol.Optional(CONF_CIRCUIT): int,
+        vol.Optional(CONF_NAME): cv.string,
+        vol.Optional(CONF_HEATING_TYPE): _HEATING_TYPE_VALIDATOR,
+    }
 )
 
+CONFIG_SCHEMA = vol.Schema({DOMAIN: _INNER_SCHEMA}, extra=vol.ALLOW_EXTRA)
+
+# Defaults are applied in async_setup instead of by the schema
+_DEFAULTS = {
+    CONF_SCAN_INTERVAL: 60,
+    CONF_NAME: "ViCare",
+    CONF_HEATING_TYPE: HeatingType(DEFAULT_HEATING_TYPE),
+}
+
 
-def setup(hass, config):
+async def async_setup(hass, config):
     """Create the ViCare component."""
-    conf = config[DOMAIN]
+    conf = {**_DEFAULTS, **config[DOMAIN]}
     params = {"token_file": hass.config.path(STORAGE_DIR, "vicare_token.save")}
     if conf.get(CONF_CIRCUIT) is not None:
         params["circuit"] = conf[CONF_CIRCUIT]
@@ -89,27 +112,86 @@ def setup(hass, config):
     params["client_id"] = conf.get(CONF_CLIENT_ID)
     heating_type = conf[CONF_HEATING_TYPE]
 
-    try:
-        if heating_type == HeatingType.gas:
-            vicare_api = GazBoiler(conf[CONF_USERNAME], conf[CONF_PASSWORD], **params)
-        elif heating_type == HeatingType.heatpump:
-            vicare_api = HeatPump(conf[CONF_USERNAME], conf[CONF_PASSWORD], **params)
-        elif heating_type == HeatingType.fuelcell:
-            vicare_api = FuelCell(conf[CONF_USERNAME], conf[CONF_PASSWORD], **params)
-        else:
-            vicare_api = Device(conf[CONF_USERNAME], conf[CONF_PASSWORD], **params)
-    except AttributeError:
-        _LOGGER.error(
-            "Failed to create PyViCare API client. Please check your credentials"
-        )
-        return False
-
     hass.data[DOMAIN] = {}
-    hass.data[DOMAIN][VICARE_API] = vicare_api
+    hass.data[DOMAIN][VICARE_API] = _LazyViCare(
+        partial(
+            _create_api,
+            heating_type,
+            conf[CONF_USERNAME],
+            conf[CONF_PASSWORD],
+            params,
+        )
+    )
     hass.data[DOMAIN][VICARE_NAME] = conf[CONF_NAME]
     hass.data[DOMAIN][VICARE_HEATING_TYPE] = heating_type
 
     for platform in PLATFORMS:
-        discovery.load_platform(hass, platform, DOMAIN, {}, config)
+        hass.async_create_task(
+            discovery.async_load_platform(hass, platform, DOMAIN, {}, config)
+        )
 
     return True
+
+
+class _LazyViCare:
+    """Create the PyViCare API client on first use.
+
+    Creating the client logs in to the ViCare cloud, so it is deferred to the
+    first attribute access which happens from the platforms' executor jobs.
+    """
+
+    def __init__(self, factory: Callable[[], Device]) -> None:
+        """Initialize the lazy client."""
+        self._factory = factory
+        self._api: Device | None = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str):
+        """Forward attribute access to the client, creating it if needed."""
+        return getattr(self._get_api(), name)
+
+    def _get_api(self) -> Device:
+        """Return the client, creating it on first call."""
+        # The client never changes once created, only lock while creating it
+        api = self._api
+        if api is not None:
+            return api
+
+        with self._lock:
+            if self._api is None:
+                # Don't log in again with credentials that were rejected
+                if self._failed:
+                    raise HomeAssistantError("PyViCare API client is not available")
+                try:
+                    self._api = self._factory()
+                except HomeAssistantError:
+                    self._failed = True
+                    raise
+            return self._api
+
+
+def _create_api(heating_type, username, password, params):
+    """Create the PyViCare API client for the heating type."""
+    # PyViCare pulls in requests and oauthlib, only import it once configured
+    # pylint: disable=import-outside-toplevel
+    from PyViCare.PyViCareDevice import Device
+    from PyViCare.PyViCareFuelCell import FuelCell
+    from PyViCare.PyViCareGazBoiler import GazBoiler
+    from PyViCare.PyViCareHeatPump import HeatPump
+
+    api_classes: dict[HeatingType, type[Device]] = {
+        HeatingType.gas: GazBoiler,
+        HeatingType.heatpump: HeatPump,
+        HeatingType.fuelcell: FuelCell,
+    }
+    api_class = api_classes.get(heating_type, Device)
+    try:
+        return api_class(username, password, **params)
+    except AttributeError as err:
+        _LOGGER.error(
+            "Failed to create PyViCare API client. Please check your credentials"
+        )
+        # Raised as a different type, AttributeError from __getattr__ of
+        # _LazyViCare would be mistaken for a missing attribute
+        raise HomeAssistantError("Failed to create PyViCare API client") from err
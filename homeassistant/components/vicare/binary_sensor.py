@@ -17,6 +17,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.exceptions import HomeAssistantError
 
 from . import (
     DOMAIN as VICARE_DOMAIN,
@@ -95,8 +96,9 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     if heating_type != HeatingType.generic:
         sensors.extend(SENSORS_BY_HEATINGTYPE[heating_type])
 
-    add_entities(
-        [
+    try:
+        # Creating the entities reads the unique ID, which logs in to ViCare
+        entities = [
             ViCareBinarySensor(
                 hass.data[VICARE_DOMAIN][VICARE_NAME], vicare_api, description
             )
@@ -107,7 +109,11 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
             )
             if description.key in sensors
         ]
-    )
+    except HomeAssistantError:
+        # Creating the API client failed, which has been logged already
+        return
+
+    add_entities(entities)
 
 
 DescriptionT = Union[
@@ -124,20 +130,18 @@ class ViCareBinarySensor(BinarySensorEntity):
 
     def __init__(self, name, api, description: DescriptionT):
         """Initialize the sensor."""
+        self.entity_description = description
         self._attr_name = f"{name} {description.name}"
         self._api = api
         self._state = None
+        # Resolve this in the executor, reading it may create the API client
+        self._attr_unique_id = f"{api.service.id}-{description.key}"
 
     @property
     def available(self):
         """Return True if entity is available."""
         return self._state is not None
 
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return f"{self._api.service.id}-{self.entity_description.key}"
-
     @property
     def is_on(self):
         """Return the state of the sensor."""
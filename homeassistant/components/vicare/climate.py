@@ -19,6 +19,7 @@ from homeassistant.components.climate.const import (
     SUPPORT_TARGET_TEMPERATURE,
 )
 from homeassistant.const import ATTR_TEMPERATURE, PRECISION_WHOLE, TEMP_CELSIUS
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_platform
 
 from . import (
@@ -191,6 +192,9 @@ class ViCareClimate(ClimateEntity):
             _LOGGER.error("Vicare API rate limit exceeded: %s", limit_exception)
         except ValueError:
             _LOGGER.error("Unable to decode data from ViCare server")
+        except HomeAssistantError:
+            # Creating the API client failed, which has been logged already
+            self._attr_available = False
 
     @property
     def supported_features(self):
@@ -24,6 +24,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TIME_HOURS,
 )
+from homeassistant.exceptions import HomeAssistantError
 
 from . import (
     DOMAIN as VICARE_DOMAIN,
@@ -345,8 +346,9 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     if heating_type != HeatingType.generic:
         sensors.extend(SENSORS_BY_HEATINGTYPE[heating_type])
 
-    add_entities(
-        [
+    try:
+        # Creating the entities reads the unique ID, which logs in to ViCare
+        entities = [
             ViCareSensor(hass.data[VICARE_DOMAIN][VICARE_NAME], vicare_api, description)
             for description in (
                 *SENSOR_TYPES_GENERIC,
@@ -356,7 +358,11 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
             )
             if description.key in sensors
         ]
-    )
+    except HomeAssistantError:
+        # Creating the API client failed, which has been logged already
+        return
+
+    add_entities(entities)
 
 
 DescriptionT = Union[
@@ -378,17 +384,14 @@ class ViCareSensor(SensorEntity):
         self._attr_name = f"{name} {description.name}"
         self._api = api
         self._state = None
+        # Resolve this in the executor, reading it may create the API client
+        self._attr_unique_id = f"{api.service.id}-{description.key}"
 
     @property
     def available(self):
         """Return True if entity is available."""
         return self._state is not None
 
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return f"{self._api.service.id}-{self.entity_description.key}"
-
     @property
     def native_value(self):
         """Return the state of the sensor."""
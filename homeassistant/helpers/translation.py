@@ -76,7 +76,7 @@ def load_translations_files(
     """Load and parse translation.json files."""
     loaded = {}
     for component, translation_file in translation_files.items():
-        loaded_json = load_json(translation_file)
+        loaded_json = load_json(translation_file, cache=True)
 
         if not isinstance(loaded_json, dict):
             _LOGGER.warning(
@@ -193,8 +193,12 @@ async def async_get_component_strings(
         if "." in loaded:
             continue
 
+        # Loaded translations are cached, add the title to a copy
         if "title" not in loaded_translation:
-            loaded_translation["title"] = integrations[loaded].name
+            loaded_translations[loaded] = {
+                **loaded_translation,
+                "title": integrations[loaded].name,
+            }
 
     translations.update(loaded_translations)
 
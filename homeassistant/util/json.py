@@ -1,18 +1,51 @@
 """JSON utility functions."""
 from __future__ import annotations
 
-from collections import deque
+import codecs
+from enum import Enum
+from functools import partial
+import io
 import json
 import logging
+import math
 import os
+import re
 import tempfile
-from typing import Any, Callable
+from typing import IO, Any, Callable, Tuple, Union
+from uuid import UUID
+
+import orjson
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Values every JSON dumper can serialize are skipped without calling dump().
+# Strings, ints and floats are only skipped within the limits all dumpers
+# share: orjson rejects lone surrogates and integers over 64 bits, and
+# allow_nan=False rejects NaN and infinity.
+_JSON_PRIMITIVES = {bool, type(None)}
+_INT_MIN = -(2 ** 63)
+_INT_MAX = 2 ** 64 - 1
+
+_Path = Tuple[Union[str, int, Tuple[str]], ...]
+
+# Content orjson cannot read back as the json module would: NaN, infinity,
+# escaped surrogates and integers that may not fit in 64 bits
+_NEEDS_JSON_MODULE = re.compile(rb"NaN|Infinity|\\u[dD][89a-fA-F]|\d{19}")
+
+# Data loaded with load_json(cache=True), keyed by filename, with the
+# modification time of the file it was read from
+_LOAD_CACHE: dict[str, tuple[int, list | dict]] = {}
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
 
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
@@ -22,17 +55,36 @@ class WriteError(HomeAssistantError):
     """Error writing the data."""
 
 
-def load_json(filename: str, default: list | dict | None = None) -> list | dict:
+def load_json(
+    filename: str, default: list | dict | None = None, *, cache: bool = False
+) -> list | dict:
     """Load JSON data from a file and return as dict or list.
 
     Defaults to returning empty dict if file is not found.
+
+    With cache=True the parsed data is kept until the modification time of
+    the file changes. Cached data is shared between callers and must not be
+    modified.
     """
     try:
-        with open(filename, encoding="utf-8") as fdesc:
-            return json.loads(fdesc.read())  # type: ignore
+        if cache:
+            mtime_ns = os.stat(filename).st_mtime_ns
+            cached = _LOAD_CACHE.get(filename)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+        with open(filename, "rb") as fdesc:
+            json_data = fdesc.read()
+        if _NEEDS_JSON_MODULE.search(json_data):
+            loaded: list | dict = json.loads(json_data)
+        else:
+            loaded = orjson.loads(json_data)
+        if cache:
+            _LOAD_CACHE[filename] = (mtime_ns, loaded)
+        return loaded
     except FileNotFoundError:
         # This is not a fatal error
         _LOGGER.debug("JSON file not found: %s", filename)
+        _LOAD_CACHE.pop(filename, None)
     except ValueError as error:
         _LOGGER.exception("Could not parse JSON content: %s", filename)
         raise HomeAssistantError(error) from error
@@ -48,43 +100,149 @@ def save_json(
     private: bool = False,
     *,
     encoder: type[json.JSONEncoder] | None = None,
+    durable: bool = True,
 ) -> None:
     """Save JSON data to a file.
 
+    With durable=False the file is written in place instead of through a
+    temporary file, it may be left incomplete if writing fails.
+
     Returns True on success.
     """
-    try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
-    except TypeError as error:
-        msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
-        _LOGGER.error(msg)
-        raise SerializationError(msg) from error
+    json_data = _orjson_dumps(data, encoder)
+    # The file is about to change, do not serve it from the cache anymore
+    _LOAD_CACHE.pop(filename, None)
+
+    if not durable:
+        if json_data is None:
+            # Serialize before the file is truncated
+            buffer = io.BytesIO()
+            _json_dump(buffer, filename, data, encoder)
+            json_data = buffer.getvalue()
+        mode = 0o600 if private else 0o644
+        try:
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+            # The mode above only applies to new files, existing ones are
+            # updated before any data is written
+            os.fchmod(fd, mode)
+            with os.fdopen(fd, "wb") as fdesc:
+                fdesc.write(json_data)
+        except OSError as error:
+            _LOGGER.exception("Saving JSON file failed: %s", filename)
+            raise WriteError(error) from error
+        return
 
     tmp_filename = ""
-    tmp_path = os.path.split(filename)[0]
+    tmp_path = os.path.dirname(filename)
     try:
         # Modern versions of Python tempfile create this file with mode 0o600
         with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", dir=tmp_path, delete=False
+            mode="wb", dir=tmp_path, delete=False
         ) as fdesc:
-            fdesc.write(json_data)
             tmp_filename = fdesc.name
+            if json_data is None:
+                # Stream into the file rather than building the whole document
+                _json_dump(fdesc, filename, data, encoder)
+            else:
+                fdesc.write(json_data)
         if not private:
             os.chmod(tmp_filename, 0o644)
         os.replace(tmp_filename, filename)
+        # The temporary file is gone now, nothing to clean up
+        tmp_filename = ""
     except OSError as error:
         _LOGGER.exception("Saving JSON file failed: %s", filename)
         raise WriteError(error) from error
     finally:
-        if os.path.exists(tmp_filename):
+        if tmp_filename:
             try:
                 os.remove(tmp_filename)
+            except FileNotFoundError:
+                pass
             except OSError as err:
                 # If we are cleaning up then something else went wrong, so
                 # we should suppress likely follow-on errors in the cleanup
                 _LOGGER.error("JSON replacement cleanup failed: %s", err)
 
 
+def _orjson_dumps(
+    data: list | dict, encoder: type[json.JSONEncoder] | None
+) -> bytes | None:
+    """Serialize data with orjson for save_json.
+
+    Returns None when orjson would not produce what the json module would.
+    """
+    default = encoder().default if encoder else None
+    if _needs_json_module(data, default):
+        return None
+    try:
+        return orjson.dumps(data, default=default, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        # orjson also rejects lone surrogates and subclasses of tuple
+        return None
+
+
+def _json_dump(
+    fdesc: IO[bytes],
+    filename: str,
+    data: list | dict,
+    encoder: type[json.JSONEncoder] | None,
+) -> None:
+    """Write data to a binary file with the json module for save_json."""
+    try:
+        json.dump(data, codecs.getwriter("utf-8")(fdesc), indent=2, cls=encoder)
+    except TypeError as error:
+        msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data, dump=partial(json.dumps, cls=encoder), max_invalid=5))}"
+        _LOGGER.error(msg)
+        raise SerializationError(msg) from error
+
+
+def _needs_json_module(data: Any, default: Callable[[Any], Any] | None) -> bool:
+    """Return if orjson would serialize data differently than the json module.
+
+    orjson writes NaN and infinity as null, fails on integers over 64 bits and
+    encodes UUIDs, plain enums and more dict key types natively where the json
+    module would hand them to the encoder.
+    """
+    to_check = [data]
+    while to_check:
+        obj = to_check.pop()
+        obj_type = type(obj)
+        if obj_type is str or obj_type is bool or obj is None:
+            continue
+        if isinstance(obj, Enum) and not isinstance(obj, (int, str)):
+            return True
+        if isinstance(obj, (int, float)):
+            if not _is_orjson_number(obj):
+                return True
+        elif isinstance(obj, dict):
+            for key in obj:
+                if type(key) is not str and not (
+                    type(key) in _JSON_PRIMITIVES
+                    or (type(key) in (int, float) and _is_orjson_number(key))
+                ):
+                    return True
+            to_check.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            to_check.extend(obj)
+        elif isinstance(obj, UUID):
+            return True
+        elif default is not None:
+            # Check what the encoder turns the object into as well
+            try:
+                to_check.append(default(obj))
+            except TypeError:
+                continue
+    return False
+
+
+def _is_orjson_number(number: int | float) -> bool:
+    """Return if orjson writes the number as the json module does."""
+    if isinstance(number, float):
+        return math.isfinite(number)
+    return _INT_MIN <= number <= _INT_MAX
+
+
 def format_unserializable_data(data: dict[str, Any]) -> str:
     """Format output of find_paths in a friendly way.
 
@@ -94,49 +252,97 @@ def format_unserializable_data(data: dict[str, Any]) -> str:
 
 
 def find_paths_unserializable_data(
-    bad_data: Any, *, dump: Callable[[Any], str] = json.dumps
+    bad_data: Any,
+    *,
+    dump: Callable[[Any], str | bytes] = json.dumps,
+    max_invalid: int | None = None,
 ) -> dict[str, Any]:
     """Find the paths to unserializable data.
 
+    Stops searching once max_invalid paths have been found, if given.
+
     This method is slow! Only use for error handling.
     """
-    to_process = deque([(bad_data, "$")])
+    # dump stays json.dumps by default: faster dumpers accept datetimes, UUIDs
+    # and dataclasses, which would hide exactly what the json module rejects.
+
+    # Paths are kept as tuples of parts and only formatted for invalid entries
+    to_process: list[tuple[Any, _Path]] = [(bad_data, ())]
     invalid = {}
 
     while to_process:
-        obj, obj_path = to_process.popleft()
+        obj, obj_path = to_process.pop()
 
-        try:
-            dump(obj)
+        obj_type = type(obj)
+        if (
+            obj_type in _JSON_PRIMITIVES
+            or (obj_type is str and obj.isascii())
+            or (obj_type is int and _INT_MIN <= obj <= _INT_MAX)
+            or (obj_type is float and math.isfinite(obj))
+        ):
             continue
-        except (ValueError, TypeError):
-            pass
 
-        # We convert objects with as_dict to their dict values so we can find bad data inside it
-        if hasattr(obj, "as_dict"):
-            desc = obj.__class__.__name__
-            if isinstance(obj, State):
-                desc += f": {obj.entity_id}"
-            elif isinstance(obj, Event):
-                desc += f": {obj.event_type}"
+        # Containers are walked rather than dumped so each node is only
+        # serialized once, anything else is left to dump() to decide
+        if not isinstance(obj, (dict, list, tuple)):
+            try:
+                dump(obj)
+                continue
+            except (ValueError, TypeError):
+                pass
+
+            # We convert objects with as_dict to their dict values so we can find bad data inside it
+            if hasattr(obj, "as_dict"):
+                desc = obj.__class__.__name__
+                if isinstance(obj, State):
+                    desc += f": {obj.entity_id}"
+                elif isinstance(obj, Event):
+                    desc += f": {obj.event_type}"
 
-            obj_path += f"({desc})"
-            obj = obj.as_dict()
+                obj_path += ((desc,),)
+                obj = obj.as_dict()
 
+        # Children are pushed in reverse so they are popped in document order
         if isinstance(obj, dict):
+            children = []
             for key, value in obj.items():
+                if type(key) is str and key.isascii():
+                    children.append((value, obj_path + (key,)))
+                    continue
                 try:
                     # Is key valid?
                     dump({key: None})
                 except TypeError:
-                    invalid[f"{obj_path}<key: {key}>"] = key
+                    invalid[f"{_format_path(obj_path)}<key: {key}>"] = key
+                    if max_invalid is not None and len(invalid) >= max_invalid:
+                        return invalid
                 else:
                     # Process value
-                    to_process.append((value, f"{obj_path}.{key}"))
-        elif isinstance(obj, list):
-            for idx, value in enumerate(obj):
-                to_process.append((value, f"{obj_path}[{idx}]"))
+                    children.append((value, obj_path + (str(key),)))
+            to_process.extend(reversed(children))
+        elif isinstance(obj, (list, tuple)):
+            for idx in reversed(range(len(obj))):
+                to_process.append((obj[idx], obj_path + (idx,)))
         else:
-            invalid[obj_path] = obj
+            invalid[_format_path(obj_path)] = obj
+            if max_invalid is not None and len(invalid) >= max_invalid:
+                return invalid
 
     return invalid
+
+
+def _format_path(path: _Path) -> str:
+    """Format a path collected by find_paths_unserializable_data.
+
+    Strings are dict keys, ints are list indexes and 1-tuples describe an
+    object that was converted with as_dict.
+    """
+    parts = ["$"]
+    for part in path:
+        if isinstance(part, str):
+            parts.append(f".{part}")
+        elif isinstance(part, int):
+            parts.append(f"[{part}]")
+        else:
+            parts.append(f"({part[0]})")
+    return "".join(parts)
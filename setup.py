@@ -1,7 +1,5 @@
 #!/usr/bin/env python3
 """Home Assistant setup script."""
-from datetime import datetime as dt
-
 from setuptools import find_packages, setup
 
 import homeassistant.const as hass_const
@@ -10,7 +8,7 @@ PROJECT_NAME = "Home Assistant"
 PROJECT_PACKAGE_NAME = "homeassistant"
 PROJECT_LICENSE = "Apache License 2.0"
 PROJECT_AUTHOR = "The Home Assistant Authors"
-PROJECT_COPYRIGHT = f" 2013-{dt.now().year}, {PROJECT_AUTHOR}"
+PROJECT_COPYRIGHT = f" 2013-{hass_const.MAJOR_VERSION}, {PROJECT_AUTHOR}"
 PROJECT_URL = "https://www.home-assistant.io/"
 PROJECT_EMAIL = "hello@home-assistant.io"
 
@@ -43,6 +41,7 @@ REQUIRES = [
     "ciso8601==2.1.3",
     "httpx==0.19.0",
     "jinja2==3.0.1",
+    "orjson==3.6.3",
     "PyJWT==2.1.0",
     # PyJWT has loose dependency. We want the latest one.
     "cryptography==3.4.8",